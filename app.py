@@ -2,14 +2,79 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional; pandas' CSV reader is used instead
+    pa_csv = None
+
+# Importing numba and loading the cached kernel costs ~0.4 s per run, while
+# the numpy path only loses ~10 ms per million rows, so the kernel is only
+# worth it for very large comparisons
+NUMBA_MIN_ROWS = 5_000_000
+_pct_change_kernel = None
+
+
+def _load_pct_change_kernel():
+    """Compile the numba percent change kernel on first use; False if numba is unavailable."""
+    global _pct_change_kernel
+    if _pct_change_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:  # numba is optional; the numpy implementation is used instead
+            _pct_change_kernel = False
+            return _pct_change_kernel
+        
+        @njit(cache=True)
+        def pct_change_kernel(curr, prev, diff_out, pct_out):
+            """Fill absolute and percent change in one pass, treating growth from zero as 100%."""
+            for i in range(curr.shape[0]):
+                d = curr[i] - prev[i]
+                diff_out[i] = d
+                if prev[i] > 0:
+                    pct_out[i] = d / prev[i] * 100.0
+                elif curr[i] > 0:
+                    pct_out[i] = 100.0
+                else:
+                    pct_out[i] = 0.0
+        
+        _pct_change_kernel = pct_change_kernel
+    return _pct_change_kernel
+
 class GA4WeekOverWeekAnalyzer:
-    def __init__(self, csv_path, output_dir='output'):
-        """Initialize the analyzer with CSV path and output directory."""
+    # (grouping column, report file name, progress label) for each detailed report
+    REPORTS = [
+        ('Session Payscale Custom Channels', 'channels_week_over_week', 'channel'),
+        ('Session source / medium', 'source_medium_week_over_week', 'source/medium'),
+        ('Page path and screen class', 'landing_pages_week_over_week', 'landing page'),
+        ('LP_Source', 'landing_page_source_week_over_week', 'landing page + source/medium'),
+        ('LP_Channel', 'landing_page_channel_week_over_week', 'landing page + channel')
+    ]
+    
+    def __init__(self, csv_path, output_dir='output', output_format='csv', engine='pandas'):
+        """Initialize the analyzer with CSV path, output directory, report format ('csv' or 'parquet')
+        and aggregation engine ('pandas' or 'polars')."""
+        if output_format not in ('csv', 'parquet'):
+            raise ValueError(f"Unsupported output format: {output_format}")
+        if engine not in ('pandas', 'polars'):
+            raise ValueError(f"Unsupported engine: {engine}")
+        
         self.csv_path = csv_path
         self.output_dir = Path(output_dir)
+        self.output_format = output_format
+        self.engine = engine
+        if engine == 'polars':
+            # polars is optional and only imported here, so the default pandas
+            # engine does not pay for the import
+            try:
+                import polars
+            except ImportError:
+                raise ImportError("engine='polars' requires the polars package") from None
+            self._pl = polars
         self.output_dir.mkdir(exist_ok=True)
         self.df = None
         self.weekly_data = {}
@@ -21,8 +86,62 @@ class GA4WeekOverWeekAnalyzer:
         # Skip comment rows (0-5) AND the grand total row (7)
         # This uses row 6 (row 7 in 1-indexed, the header row) as the header
         # and starts reading data from row 8 (row 9 in 1-indexed)
-        rows_to_skip = list(range(6)) + [7]  # Skip rows 0-5 and row 7 (grand total)
-        self.df = pd.read_csv(self.csv_path, skiprows=rows_to_skip, header=0)
+        if self.engine == 'polars':
+            # Parse the file once with polars; the same frame feeds the report
+            # aggregations in _polars_pipeline, and the pandas copy below is
+            # used for the date checks and the summary
+            pl = self._pl
+            self._polars_frame = pl.scan_csv(
+                self.csv_path,
+                skip_rows=6,  # Comment rows before the header
+                skip_rows_after_header=1,  # Grand total row
+                schema_overrides={
+                    'Date': pl.Utf8,
+                    'Total users': pl.Int64,
+                    'Key events': pl.Int64,
+                    'Engagement rate': pl.Float64,
+                    'User key event rate': pl.Float64
+                }
+            ).collect()
+            
+            # Same downcast as the pandas path below, so both engines report
+            # the same dtypes (polars sums narrow integers as Int64)
+            frame = self._polars_frame
+            self._polars_frame = frame.with_columns(
+                frame['Total users'].shrink_dtype(),
+                frame['Key events'].shrink_dtype(),
+                pl.col('Engagement rate', 'User key event rate').cast(pl.Float32)
+            )
+            self.df = self._polars_frame.to_pandas(use_pyarrow_extension_array=True)
+        elif pa_csv is not None:
+            # pyarrow parses the file in parallel blocks straight into typed
+            # Arrow columns; Date stays text (YYYYMMDD) until to_datetime below
+            column_types = {
+                'Date': pa.string(),
+                'Total users': pa.int64(),
+                'Key events': pa.int64(),
+                'Engagement rate': pa.float64(),
+                'User key event rate': pa.float64()
+            }
+            table = pa_csv.read_csv(
+                self.csv_path,
+                read_options=pa_csv.ReadOptions(skip_rows=6, skip_rows_after_names=1),
+                convert_options=pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True)
+            )
+            self.df = table.to_pandas(types_mapper=pd.ArrowDtype)
+        else:
+            rows_to_skip = list(range(6)) + [7]  # Skip rows 0-5 and row 7 (grand total)
+            
+            # Read Date as text (YYYYMMDD) and type the metrics up front so no
+            # post-load casts are needed
+            dtypes = {
+                'Date': 'string',
+                'Total users': 'Int64',
+                'Key events': 'Int64',
+                'Engagement rate': 'Float64',
+                'User key event rate': 'Float64'
+            }
+            self.df = pd.read_csv(self.csv_path, skiprows=rows_to_skip, header=0, dtype=dtypes)
         
         # Debug: Check what we loaded
         print(f"Initial shape: {self.df.shape}")
@@ -38,27 +157,22 @@ class GA4WeekOverWeekAnalyzer:
         print(f"\nDate column dtype: {self.df['Date'].dtype}")
         print(f"First 5 date values: {self.df['Date'].head().tolist()}")
         
-        # Convert date column - handle both string and numeric formats
-        if self.df['Date'].dtype == 'object':
-            # It's already a string
-            self.df['Date'] = pd.to_datetime(self.df['Date'], format='%Y%m%d', errors='coerce')
-        else:
-            # It's numeric, convert to string first
-            self.df['Date'] = self.df['Date'].astype(int).astype(str)
-            self.df['Date'] = pd.to_datetime(self.df['Date'], format='%Y%m%d', errors='coerce')
+        # Convert date column; cache=True parses each distinct date string once
+        self.df['Date'] = pd.to_datetime(self.df['Date'], format='%Y%m%d', errors='coerce', cache=True)
         
         print(f"Dates after conversion - valid: {self.df['Date'].notna().sum()}, invalid: {self.df['Date'].isna().sum()}")
         
         # Remove any rows with invalid dates
         initial_rows = len(self.df)
-        self.df = self.df.dropna(subset=['Date']).copy()
+        self.df = self.df.dropna(subset=['Date'])
         print(f"Removed {initial_rows - len(self.df)} rows with invalid dates")
         
-        # Convert numeric columns
-        numeric_cols = ['Total users', 'Engagement rate', 'Key events', 'User key event rate']
-        for col in numeric_cols:
-            if col in self.df.columns:
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce')
+        # Downcast metrics to halve the bytes every aggregation has to move;
+        # counts get the smallest integer type that fits (sums still come back as int64)
+        for col in ['Total users', 'Key events']:
+            self.df[col] = pd.to_numeric(self.df[col], downcast='integer')
+        for col in ['Engagement rate', 'User key event rate']:
+            self.df[col] = pd.to_numeric(self.df[col], downcast='float')
         
         print(f"\nLoaded {len(self.df)} rows of data")
         if len(self.df) > 0:
@@ -72,9 +186,9 @@ class GA4WeekOverWeekAnalyzer:
         """Group data by week."""
         print("\nGrouping data by week...")
         
-        # Add week number (Monday as start of week)
-        self.df['Week'] = self.df['Date'].dt.to_period('W-SUN')
-        self.df['Week_Start'] = self.df['Week'].apply(lambda x: x.start_time)
+        # Add week start (Monday as start of week) by stepping back to Monday
+        days_since_monday = pd.to_timedelta(self.df['Date'].dt.dayofweek, unit='D')
+        self.df['Week_Start'] = (self.df['Date'] - days_since_monday).dt.normalize()
         
         # Get unique weeks sorted
         weeks = sorted(self.df['Week_Start'].unique())
@@ -92,18 +206,22 @@ class GA4WeekOverWeekAnalyzer:
         
         missing_dates_by_week = {}
         
+        # Collect the dates present in each week in one pass over the data,
+        # kept as datetime64 values (no Python date objects)
+        actual_by_week = {
+            week: np.asarray(dates.dt.normalize().unique())
+            for week, dates in self.df.groupby('Week_Start')['Date']
+        }
+        
         for i, week in enumerate(weeks, 1):
             week_end = week + timedelta(days=6)
             
             # Get all dates that should be in this week
             expected_dates = pd.date_range(start=week, end=week_end, freq='D')
             
-            # Get actual dates in the data for this week
-            actual_dates = self.df[self.df['Week_Start'] == week]['Date'].dt.date.unique()
-            actual_dates = pd.to_datetime(actual_dates)
-            
-            # Find missing dates
-            missing = [d for d in expected_dates if d not in actual_dates]
+            # Find missing dates with a set difference on the datetime64 values
+            actual_dates = actual_by_week.get(week, np.array([], dtype=expected_dates.dtype))
+            missing = list(pd.DatetimeIndex(np.setdiff1d(expected_dates.to_numpy(), actual_dates)))
             
             if missing:
                 missing_dates_by_week[i] = {
@@ -119,170 +237,292 @@ class GA4WeekOverWeekAnalyzer:
     
     def aggregate_weekly_data(self, group_by_col, weeks):
         """Aggregate data by week for a specific grouping column."""
-        weekly_agg = []
-        
-        for week in weeks:
-            week_data = self.df[self.df['Week_Start'] == week].copy()
-            
-            if len(week_data) == 0:
-                continue
-            
-            grouped = week_data.groupby(group_by_col).agg({
-                'Total users': 'sum',
-                'Key events': 'sum',
-                'Engagement rate': 'mean',
-                'User key event rate': 'mean'
-            }).reset_index()
-            
-            grouped['Week_Start'] = week
-            weekly_agg.append(grouped)
-        
-        if weekly_agg:
-            return pd.concat(weekly_agg, ignore_index=True)
-        return pd.DataFrame()
+        # Single pass over the frame: group on (week, key) instead of
+        # re-filtering the full DataFrame once per week
+        grouped = self.df[self.df['Week_Start'].isin(weeks)].groupby(
+            ['Week_Start', group_by_col], sort=False, observed=True
+        ).agg(
+            total_users=('Total users', 'sum'),
+            key_events=('Key events', 'sum'),
+            engagement=('Engagement rate', 'mean'),
+            ukr=('User key event rate', 'mean')
+        ).reset_index()
+        
+        grouped = grouped.rename(columns={
+            'total_users': 'Total users',
+            'key_events': 'Key events',
+            'engagement': 'Engagement rate',
+            'ukr': 'User key event rate'
+        })
+        
+        # Keep the original column layout (group column first, week last)
+        return grouped[[group_by_col, 'Total users', 'Key events',
+                        'Engagement rate', 'User key event rate', 'Week_Start']]
     
-    def calculate_week_over_week(self, df, weeks, group_col):
-        """Calculate week-over-week changes."""
-        comparisons = []
+    def _polars_pipeline(self, weeks):
+        """Aggregate all report groupings with a lazy polars query over the frame read by load_data."""
+        pl = self._pl
+        lf = self._polars_frame.lazy()
+        
+        page = pl.col('Page path and screen class')
+        lf = lf.with_columns(
+            pl.col('Date').str.strptime(pl.Date, '%Y%m%d', strict=False)
+        ).filter(
+            pl.col('Date').is_not_null()
+        ).with_columns(
+            # Truncating to 1w gives the Monday that starts each week
+            Week_Start=pl.col('Date').dt.truncate('1w').cast(pl.Datetime('us')),
+            LP_Source=pl.concat_str([page, pl.col('Session source / medium')], separator=' | '),
+            LP_Channel=pl.concat_str([page, pl.col('Session Payscale Custom Channels')], separator=' | ')
+        ).filter(
+            pl.col('Week_Start').is_in(pd.to_datetime(weeks).to_pydatetime().tolist())
+        )
         
-        for i in range(len(weeks) - 1):
-            current_week = weeks[i + 1]
-            previous_week = weeks[i]
-            
-            current_data = df[df['Week_Start'] == current_week].copy()
-            previous_data = df[df['Week_Start'] == previous_week].copy()
-            
-            # Merge on the grouping column
-            merged = current_data.merge(
-                previous_data,
-                on=group_col,
-                suffixes=('_current', '_previous'),
-                how='outer'
-            )
-            
-            # Fill NaN values with 0 for calculations
-            merged = merged.fillna(0)
-            
-            # Calculate changes
-            merged['Users_Change'] = merged['Total users_current'] - merged['Total users_previous']
-            merged['Users_Change_Pct'] = np.where(
-                merged['Total users_previous'] > 0,
-                ((merged['Total users_current'] - merged['Total users_previous']) / 
-                 merged['Total users_previous'] * 100),
-                np.where(merged['Total users_current'] > 0, 100, 0)
+        queries = []
+        for group_col, _, _ in self.REPORTS:
+            queries.append(
+                lf.filter(pl.col(group_col).is_not_null())
+                .group_by(['Week_Start', group_col])
+                .agg(
+                    pl.col('Total users').sum(),
+                    pl.col('Key events').sum(),
+                    # Sum and divide in float32 like pandas' grouped mean;
+                    # polars' mean() accumulates in float64 and rounds differently
+                    (pl.col('Engagement rate').sum()
+                     / pl.col('Engagement rate').count().cast(pl.Float32)),
+                    (pl.col('User key event rate').sum()
+                     / pl.col('User key event rate').count().cast(pl.Float32))
+                )
+                .select([group_col, 'Total users', 'Key events',
+                         'Engagement rate', 'User key event rate', 'Week_Start'])
             )
-            
-            merged['Key_Events_Change'] = merged['Key events_current'] - merged['Key events_previous']
-            merged['Key_Events_Change_Pct'] = np.where(
-                merged['Key events_previous'] > 0,
-                ((merged['Key events_current'] - merged['Key events_previous']) / 
-                 merged['Key events_previous'] * 100),
-                np.where(merged['Key events_current'] > 0, 100, 0)
-            )
-            
-            merged['Engagement_Change'] = (merged['Engagement rate_current'] - 
-                                          merged['Engagement rate_previous'])
-            
-            merged['Week_Comparison'] = f"Week {i+2} vs Week {i+1}"
-            merged['Current_Week'] = current_week
-            merged['Previous_Week'] = previous_week
-            
-            comparisons.append(merged)
-        
-        if comparisons:
-            return pd.concat(comparisons, ignore_index=True)
-        return pd.DataFrame()
-    
-    def generate_channel_report(self, weeks):
-        """Generate channel analysis report."""
-        print("\nGenerating channel analysis...")
-        
-        channel_weekly = self.aggregate_weekly_data('Session Payscale Custom Channels', weeks)
-        channel_wow = self.calculate_week_over_week(
-            channel_weekly, weeks, 'Session Payscale Custom Channels'
-        )
         
-        # Save detailed CSV
-        output_file = self.output_dir / 'channels_week_over_week.csv'
-        channel_wow.to_csv(output_file, index=False)
-        print(f"Saved: {output_file}")
+        # collect_all runs the five groupings together, sharing the prepared columns
+        frames = pl.collect_all(queries)
         
-        return channel_wow
+        # Hand pandas frames to the existing report code only at this point
+        return {
+            group_col: frame.to_pandas()
+            for (group_col, _, _), frame in zip(self.REPORTS, frames)
+        }
     
-    def generate_source_medium_report(self, weeks):
-        """Generate source/medium analysis report."""
-        print("Generating source/medium analysis...")
-        
-        sm_weekly = self.aggregate_weekly_data('Session source / medium', weeks)
-        sm_wow = self.calculate_week_over_week(
-            sm_weekly, weeks, 'Session source / medium'
-        )
-        
-        # Save detailed CSV
-        output_file = self.output_dir / 'source_medium_week_over_week.csv'
-        sm_wow.to_csv(output_file, index=False)
-        print(f"Saved: {output_file}")
-        
-        return sm_wow
+    def _combine_categories(self, left_col, right_col):
+        """Build a 'left | right' categorical from the codes of two categorical columns."""
+        left = self.df[left_col].cat
+        right = self.df[right_col].cat
+        left_codes = left.codes.to_numpy(dtype=np.int64)
+        right_codes = right.codes.to_numpy(dtype=np.int64)
+        
+        # One integer per (left, right) pair; rows missing either side stay missing
+        valid = (left_codes >= 0) & (right_codes >= 0)
+        pair_codes = left_codes * len(right.categories) + right_codes
+        unique_pairs, pair_index = np.unique(pair_codes[valid], return_inverse=True)
+        
+        # Only build display strings for the distinct pairs, not for every row
+        left_idx, right_idx = np.divmod(unique_pairs, len(right.categories))
+        labels = pd.Categorical([
+            f"{l} | {r}" for l, r in zip(left.categories[left_idx], right.categories[right_idx])
+        ])
+        
+        codes = np.full(len(self.df), -1, dtype=labels.codes.dtype)
+        codes[valid] = labels.codes[pair_index]
+        
+        return pd.Categorical.from_codes(codes, categories=labels.categories)
     
-    def generate_landing_page_report(self, weeks):
-        """Generate landing page analysis report."""
-        print("Generating landing page analysis...")
-        
-        lp_weekly = self.aggregate_weekly_data('Page path and screen class', weeks)
-        lp_wow = self.calculate_week_over_week(
-            lp_weekly, weeks, 'Page path and screen class'
+    def calculate_week_over_week(self, df, weeks, group_col):
+        """Calculate week-over-week changes."""
+        if df.empty or len(weeks) < 2:
+            return pd.DataFrame()
+        
+        metrics = ['Total users', 'Key events', 'Engagement rate', 'User key event rate']
+        
+        # Scatter the aggregates straight into dense (group x week) matrices so
+        # all consecutive week pairs are compared with plain array slicing
+        key_codes, keys = pd.factorize(df[group_col], sort=True)
+        keys = np.asarray(keys, dtype=object)
+        week_codes = pd.Index(weeks).get_indexer(df['Week_Start'])
+        rows = (key_codes >= 0) & (week_codes >= 0)
+        key_codes, week_codes = key_codes[rows], week_codes[rows]
+        n_keys = len(keys)
+        n_pairs = len(weeks) - 1
+        
+        # A group is present in a week if it had any rows aggregated for it
+        present = np.zeros((n_keys, len(weeks)), dtype=bool)
+        present[key_codes, week_codes] = True
+        current_present = present[:, 1:].T.ravel()
+        previous_present = present[:, :-1].T.ravel()
+        
+        # Keep only groups seen in at least one week of each pair (outer join)
+        keep = current_present | previous_present
+        
+        result = {group_col: np.tile(keys, n_pairs)[keep]}
+        current = {}
+        previous = {}
+        # Every metric fills the same (group, week) cells, so one zeroed buffer
+        # per dtype is reused and only the present cells are overwritten
+        buffers = {}
+        for metric in metrics:
+            # Groups absent from a week (and missing values) count as 0
+            dtype = np.int64 if pd.api.types.is_integer_dtype(df[metric].dtype) else np.float64
+            if dtype not in buffers:
+                buffers[dtype] = np.zeros((n_keys, len(weeks)), dtype=dtype)
+            values = buffers[dtype]
+            values[key_codes, week_codes] = df[metric].to_numpy(dtype=dtype, na_value=0)[rows]
+            # Flatten week pairs in comparison order: all groups for pair 1, then pair 2, ...
+            current[metric] = values[:, 1:].T.ravel()[keep]
+            previous[metric] = values[:, :-1].T.ravel()[keep]
+        
+        for metric in metrics:
+            result[f'{metric}_current'] = current[metric]
+        result['Week_Start_current'] = self._week_start_values(weeks[1:], n_keys, keep, current_present)
+        for metric in metrics:
+            result[f'{metric}_previous'] = previous[metric]
+        result['Week_Start_previous'] = self._week_start_values(weeks[:-1], n_keys, keep, previous_present)
+        
+        # Calculate changes
+        result['Users_Change'], result['Users_Change_Pct'] = self._percent_change(
+            current['Total users'], previous['Total users']
         )
-        
-        # Save detailed CSV
-        output_file = self.output_dir / 'landing_pages_week_over_week.csv'
-        lp_wow.to_csv(output_file, index=False)
-        print(f"Saved: {output_file}")
-        
-        return lp_wow
-    
-    def generate_landing_page_source_report(self, weeks):
-        """Generate landing page + source/medium combination analysis."""
-        print("Generating landing page + source/medium analysis...")
-        
-        # Create combined grouping column
-        self.df['LP_Source'] = self.df['Page path and screen class'] + ' | ' + self.df['Session source / medium']
-        
-        lp_source_weekly = self.aggregate_weekly_data('LP_Source', weeks)
-        lp_source_wow = self.calculate_week_over_week(
-            lp_source_weekly, weeks, 'LP_Source'
+        result['Key_Events_Change'], result['Key_Events_Change_Pct'] = self._percent_change(
+            current['Key events'], previous['Key events']
         )
         
-        # Save detailed CSV
-        output_file = self.output_dir / 'landing_page_source_week_over_week.csv'
-        lp_source_wow.to_csv(output_file, index=False)
-        print(f"Saved: {output_file}")
+        result['Engagement_Change'] = current['Engagement rate'] - previous['Engagement rate']
         
-        return lp_source_wow
-    
-    def generate_landing_page_channel_report(self, weeks):
-        """Generate landing page + channel combination analysis."""
-        print("Generating landing page + channel analysis...")
+        labels = np.array([f"Week {i+2} vs Week {i+1}" for i in range(n_pairs)], dtype=object)
+        result['Week_Comparison'] = np.repeat(labels, n_keys)[keep]
+        result['Current_Week'] = np.repeat(pd.DatetimeIndex(weeks[1:]).to_numpy(), n_keys)[keep]
+        result['Previous_Week'] = np.repeat(pd.DatetimeIndex(weeks[:-1]).to_numpy(), n_keys)[keep]
         
-        # Create combined grouping column
-        self.df['LP_Channel'] = self.df['Page path and screen class'] + ' | ' + self.df['Session Payscale Custom Channels']
+        return pd.DataFrame(result)
+    
+    def _week_start_values(self, weeks, n_keys, keep, present):
+        """Week start for each kept row, or 0 where the group had no data that week."""
+        present = present[keep]
+        if present.all():
+            return np.repeat(pd.DatetimeIndex(weeks).to_numpy(), n_keys)[keep]
+        
+        # Only the kept rows become objects, and 0 is filled in place
+        values = np.repeat(np.asarray(weeks, dtype=object), n_keys)[keep]
+        values[~present] = 0
+        return values
+    
+    def _percent_change(self, current, previous):
+        """Return absolute and percent change, treating growth from zero as 100%."""
+        kernel = _load_pct_change_kernel() if len(current) >= NUMBA_MIN_ROWS else False
+        if kernel:
+            change = np.empty(len(current), dtype=np.result_type(current, previous))
+            pct = np.empty(len(current), dtype=np.float64)
+            kernel(current, previous, change, pct)
+            return change, pct
+        
+        change = current - previous
+        
+        # Only divide where there is a previous value; no zero-division work
+        pct = np.zeros(len(change))
+        np.divide(change, previous, out=pct, where=previous > 0)
+        pct *= 100
+        pct[(previous <= 0) & (current > 0)] = 100
+        
+        return change, pct
+    
+    def save_report(self, df, name):
+        """Save a detailed report in the configured output format."""
+        if self.output_format == 'parquet':
+            # Parquet needs one type per column; the CSV uses 0 for weeks a group was absent
+            df = df.assign(**{
+                col: pd.to_datetime(df[col].where(df[col] != 0))
+                for col in ['Week_Start_current', 'Week_Start_previous']
+                if col in df.columns
+            })
+            
+            output_file = self.output_dir / f'{name}.parquet'
+            df.to_parquet(output_file, index=False, compression='zstd')
+        else:
+            output_file = self.output_dir / f'{name}.csv'
+            df.to_csv(output_file, index=False)
         
-        lp_channel_weekly = self.aggregate_weekly_data('LP_Channel', weeks)
-        lp_channel_wow = self.calculate_week_over_week(
-            lp_channel_weekly, weeks, 'LP_Channel'
-        )
+        return output_file
+    
+    def aggregate_all_groupings(self, weeks):
+        """Aggregate every report grouping, compute week-over-week changes and save the reports."""
+        print("\nGenerating reports...")
         
-        # Save detailed CSV
-        output_file = self.output_dir / 'landing_page_channel_week_over_week.csv'
-        lp_channel_wow.to_csv(output_file, index=False)
-        print(f"Saved: {output_file}")
+        if self.engine == 'polars':
+            polars_weekly = self._polars_pipeline(weeks)
+        else:
+            # Sort once by week so every groupby below walks the weeks contiguously
+            self.df = self.df.sort_values('Week_Start', kind='stable', ignore_index=True)
+            
+            # Categorical keys let groupby hash small integer codes instead of strings
+            base_cols = [
+                'Session Payscale Custom Channels',
+                'Session source / medium',
+                'Page path and screen class'
+            ]
+            for col in base_cols:
+                self.df[col] = self.df[col].astype('category')
+            
+            # Create combined grouping columns once for the combination reports
+            self.df['LP_Source'] = self._combine_categories('Page path and screen class', 'Session source / medium')
+            self.df['LP_Channel'] = self._combine_categories('Page path and screen class', 'Session Payscale Custom Channels')
+        
+        results = {}
+        # Report writes are I/O bound, so they overlap with the next grouping's aggregation
+        with ThreadPoolExecutor() as executor:
+            pending = []
+            for group_col, name, label in self.REPORTS:
+                print(f"Generating {label} analysis...")
+                if self.engine == 'polars':
+                    self.weekly_data[group_col] = polars_weekly[group_col]
+                else:
+                    self.weekly_data[group_col] = self.aggregate_weekly_data(group_col, weeks)
+                results[group_col] = self.calculate_week_over_week(
+                    self.weekly_data[group_col], weeks, group_col
+                )
+                pending.append(executor.submit(self.save_report, results[group_col], name))
+            
+            for future in pending:
+                print(f"Saved: {future.result()}")
         
-        return lp_channel_wow
+        return results
+    
+    def _top_n(self, df, column, n):
+        """Return the n rows with the largest values in column, skipping NaN."""
+        values = df[column].to_numpy(dtype=np.float64)
+        candidates = np.flatnonzero(~np.isnan(values))
+        
+        # Partial sort to find the nth largest value, then keep everything at or
+        # above it so ties resolve to the earliest rows like nlargest(keep='first')
+        if len(candidates) > n:
+            kth = -np.partition(-values[candidates], n - 1)[n - 1]
+            candidates = candidates[values[candidates] >= kth]
+        
+        order = candidates[np.argsort(-values[candidates], kind='stable')][:n]
+        return df.iloc[order]
+    
+    def _iter_columns(self, df, columns):
+        """Iterate over rows as plain tuples of the given columns (no per-row Series)."""
+        return zip(*(df[col].to_numpy() for col in columns))
     
     def generate_executive_summary(self, channel_wow, sm_wow, lp_wow, lp_source_wow, lp_channel_wow, weeks, missing_dates_info):
         """Generate executive summary in Markdown format."""
         print("\nGenerating executive summary...")
         
+        # Split each report by comparison once instead of masking it per week
+        reports = {
+            'channel': channel_wow,
+            'sm': sm_wow,
+            'lp': lp_wow,
+            'lp_source': lp_source_wow,
+            'lp_channel': lp_channel_wow
+        }
+        groups = {
+            name: {week_comp: group for week_comp, group in df.groupby('Week_Comparison', sort=False)}
+            for name, df in reports.items()
+        }
+        empty = {name: df.iloc[:0] for name, df in reports.items()}
+        
         md_content = []
         md_content.append("# GA4 Week-over-Week Executive Summary")
         md_content.append(f"\n**Analysis Period:** {self.df['Date'].min().strftime('%B %d, %Y')} - {self.df['Date'].max().strftime('%B %d, %Y')}")
@@ -335,7 +575,7 @@ class GA4WeekOverWeekAnalyzer:
                 md_content.append("\n⚠️ *This comparison includes incomplete week(s) - see Data Completeness Notice above.*\n")
             
             # NEW: Full Channel Performance Table
-            channel_data = channel_wow[channel_wow['Week_Comparison'] == week_comp].copy()
+            channel_data = groups['channel'].get(week_comp, empty['channel'])
             if not channel_data.empty:
                 md_content.append("\n#### Complete Channel Performance Table\n")
                 md_content.append("\n")  # Add blank line before table
@@ -347,16 +587,21 @@ class GA4WeekOverWeekAnalyzer:
                 md_content.append("| Channel | Current Week Users | Previous Week Users | User Change | User Change % | Current Week Key Events | Previous Week Key Events | Key Event Change | Key Event Change % |\n")
                 md_content.append("|---------|-------------------:|--------------------:|------------:|--------------:|------------------------:|-------------------------:|-----------------:|-------------------:|\n")
                 
-                for _, row in channel_data.iterrows():
-                    md_content.append(f"| {row['Session Payscale Custom Channels']} | "
-                                    f"{row['Total users_current']:,.0f} | "
-                                    f"{row['Total users_previous']:,.0f} | "
-                                    f"{row['Users_Change']:+,.0f} | "
-                                    f"{row['Users_Change_Pct']:+.1f}% | "
-                                    f"{row['Key events_current']:,.0f} | "
-                                    f"{row['Key events_previous']:,.0f} | "
-                                    f"{row['Key_Events_Change']:+,.0f} | "
-                                    f"{row['Key_Events_Change_Pct']:+.1f}% |\n")
+                table_rows = self._iter_columns(channel_data, [
+                    'Session Payscale Custom Channels',
+                    'Total users_current', 'Total users_previous', 'Users_Change', 'Users_Change_Pct',
+                    'Key events_current', 'Key events_previous', 'Key_Events_Change', 'Key_Events_Change_Pct'
+                ])
+                for channel, users_cur, users_prev, users_chg, users_pct, events_cur, events_prev, events_chg, events_pct in table_rows:
+                    md_content.append(f"| {channel} | "
+                                    f"{users_cur:,.0f} | "
+                                    f"{users_prev:,.0f} | "
+                                    f"{users_chg:+,.0f} | "
+                                    f"{users_pct:+.1f}% | "
+                                    f"{events_cur:,.0f} | "
+                                    f"{events_prev:,.0f} | "
+                                    f"{events_chg:+,.0f} | "
+                                    f"{events_pct:+.1f}% |\n")
                 
                 md_content.append("\n")
                 
@@ -366,21 +611,25 @@ class GA4WeekOverWeekAnalyzer:
                 # Top gainers
                 top_gainers = channel_data.head(3)
                 md_content.append("**Biggest User Increases:**\n")
-                for _, row in top_gainers.iterrows():
-                    md_content.append(f"- **{row['Session Payscale Custom Channels']}**: "
-                                    f"{row['Users_Change']:+,.0f} users "
-                                    f"({row['Users_Change_Pct']:+.1f}%)\n")
+                for channel, users_chg, users_pct in self._iter_columns(
+                    top_gainers, ['Session Payscale Custom Channels', 'Users_Change', 'Users_Change_Pct']
+                ):
+                    md_content.append(f"- **{channel}**: "
+                                    f"{users_chg:+,.0f} users "
+                                    f"({users_pct:+.1f}%)\n")
                 
                 # Top decliners
                 top_decliners = channel_data.tail(3).iloc[::-1]  # Reverse to show worst first
                 md_content.append("\n**Biggest User Decreases:**\n")
-                for _, row in top_decliners.iterrows():
-                    md_content.append(f"- **{row['Session Payscale Custom Channels']}**: "
-                                    f"{row['Users_Change']:+,.0f} users "
-                                    f"({row['Users_Change_Pct']:+.1f}%)\n")
+                for channel, users_chg, users_pct in self._iter_columns(
+                    top_decliners, ['Session Payscale Custom Channels', 'Users_Change', 'Users_Change_Pct']
+                ):
+                    md_content.append(f"- **{channel}**: "
+                                    f"{users_chg:+,.0f} users "
+                                    f"({users_pct:+.1f}%)\n")
             
             # Source/Medium insights
-            sm_data = sm_wow[sm_wow['Week_Comparison'] == week_comp]
+            sm_data = groups['sm'].get(week_comp, empty['sm'])
             if not sm_data.empty:
                 md_content.append("\n#### Top Source/Medium Changes\n")
                 
@@ -388,16 +637,18 @@ class GA4WeekOverWeekAnalyzer:
                 sm_data_significant = sm_data[sm_data['Total users_current'] > 100]
                 
                 if not sm_data_significant.empty:
-                    top_sm_gainers = sm_data_significant.nlargest(5, 'Users_Change')
+                    top_sm_gainers = self._top_n(sm_data_significant, 'Users_Change', 5)
                     md_content.append("**Biggest Traffic Increases:**\n")
-                    for _, row in top_sm_gainers.iterrows():
-                        md_content.append(f"- **{row['Session source / medium']}**: "
-                                        f"{row['Users_Change']:+,.0f} users "
-                                        f"({row['Users_Change_Pct']:+.1f}%) | "
-                                        f"{row['Key events_current']:.0f} key events\n")
+                    for source, users_chg, users_pct, events_cur in self._iter_columns(
+                        top_sm_gainers, ['Session source / medium', 'Users_Change', 'Users_Change_Pct', 'Key events_current']
+                    ):
+                        md_content.append(f"- **{source}**: "
+                                        f"{users_chg:+,.0f} users "
+                                        f"({users_pct:+.1f}%) | "
+                                        f"{events_cur:.0f} key events\n")
             
             # Landing page insights
-            lp_data = lp_wow[lp_wow['Week_Comparison'] == week_comp]
+            lp_data = groups['lp'].get(week_comp, empty['lp'])
             if not lp_data.empty:
                 md_content.append("\n#### Top Landing Page Changes\n")
                 
@@ -405,15 +656,17 @@ class GA4WeekOverWeekAnalyzer:
                 lp_data_significant = lp_data[lp_data['Total users_current'] > 50]
                 
                 if not lp_data_significant.empty:
-                    top_lp_gainers = lp_data_significant.nlargest(5, 'Users_Change')
+                    top_lp_gainers = self._top_n(lp_data_significant, 'Users_Change', 5)
                     md_content.append("**Highest Traffic Growth Pages:**\n")
-                    for _, row in top_lp_gainers.iterrows():
-                        md_content.append(f"- `{row['Page path and screen class']}`: "
-                                        f"{row['Users_Change']:+,.0f} users "
-                                        f"({row['Users_Change_Pct']:+.1f}%)\n")
+                    for page, users_chg, users_pct in self._iter_columns(
+                        top_lp_gainers, ['Page path and screen class', 'Users_Change', 'Users_Change_Pct']
+                    ):
+                        md_content.append(f"- `{page}`: "
+                                        f"{users_chg:+,.0f} users "
+                                        f"({users_pct:+.1f}%)\n")
             
             # Landing Page + Source/Medium combinations
-            lp_source_data = lp_source_wow[lp_source_wow['Week_Comparison'] == week_comp]
+            lp_source_data = groups['lp_source'].get(week_comp, empty['lp_source'])
             if not lp_source_data.empty:
                 md_content.append("\n#### Top Landing Page + Source/Medium Combinations\n")
                 
@@ -421,17 +674,19 @@ class GA4WeekOverWeekAnalyzer:
                 lp_source_significant = lp_source_data[lp_source_data['Total users_current'] > 50]
                 
                 if not lp_source_significant.empty:
-                    top_combos = lp_source_significant.nlargest(5, 'Users_Change')
+                    top_combos = self._top_n(lp_source_significant, 'Users_Change', 5)
                     md_content.append("**Highest Growth Combinations:**\n")
-                    for _, row in top_combos.iterrows():
-                        parts = row['LP_Source'].split(' | ')
+                    for combo, users_chg, users_pct, events_cur in self._iter_columns(
+                        top_combos, ['LP_Source', 'Users_Change', 'Users_Change_Pct', 'Key events_current']
+                    ):
+                        parts = combo.split(' | ')
                         md_content.append(f"- **{parts[1]}** → `{parts[0]}`: "
-                                        f"{row['Users_Change']:+,.0f} users "
-                                        f"({row['Users_Change_Pct']:+.1f}%) | "
-                                        f"{row['Key events_current']:.0f} conversions\n")
+                                        f"{users_chg:+,.0f} users "
+                                        f"({users_pct:+.1f}%) | "
+                                        f"{events_cur:.0f} conversions\n")
             
             # Landing Page + Channel combinations
-            lp_channel_data = lp_channel_wow[lp_channel_wow['Week_Comparison'] == week_comp]
+            lp_channel_data = groups['lp_channel'].get(week_comp, empty['lp_channel'])
             if not lp_channel_data.empty:
                 md_content.append("\n#### Top Landing Page + Channel Combinations\n")
                 
@@ -439,13 +694,15 @@ class GA4WeekOverWeekAnalyzer:
                 lp_channel_significant = lp_channel_data[lp_channel_data['Total users_current'] > 50]
                 
                 if not lp_channel_significant.empty:
-                    top_channel_combos = lp_channel_significant.nlargest(5, 'Users_Change')
+                    top_channel_combos = self._top_n(lp_channel_significant, 'Users_Change', 5)
                     md_content.append("**Highest Growth Channel Combinations:**\n")
-                    for _, row in top_channel_combos.iterrows():
-                        parts = row['LP_Channel'].split(' | ')
+                    for combo, users_chg, users_pct in self._iter_columns(
+                        top_channel_combos, ['LP_Channel', 'Users_Change', 'Users_Change_Pct']
+                    ):
+                        parts = combo.split(' | ')
                         md_content.append(f"- **{parts[1]}** → `{parts[0]}`: "
-                                        f"{row['Users_Change']:+,.0f} users "
-                                        f"({row['Users_Change_Pct']:+.1f}%)\n")
+                                        f"{users_chg:+,.0f} users "
+                                        f"({users_pct:+.1f}%)\n")
             
             md_content.append("\n---\n")
         
@@ -471,35 +728,41 @@ class GA4WeekOverWeekAnalyzer:
         }).reset_index()
         
         # Top performing channels overall
-        top_channels = channel_totals.nlargest(3, 'Users_Change')
+        top_channels = self._top_n(channel_totals, 'Users_Change', 3)
         insights.append("**Strongest Performing Channels (Overall):**\n")
-        for _, row in top_channels.iterrows():
-            insights.append(f"- {row['Session Payscale Custom Channels']}: "
-                          f"+{row['Users_Change']:,.0f} users, "
-                          f"+{row['Key_Events_Change']:.0f} key events\n")
+        for channel, users_chg, events_chg in self._iter_columns(
+            top_channels, ['Session Payscale Custom Channels', 'Users_Change', 'Key_Events_Change']
+        ):
+            insights.append(f"- {channel}: "
+                          f"+{users_chg:,.0f} users, "
+                          f"+{events_chg:.0f} key events\n")
         
         # Engagement insights
         insights.append("\n### Engagement Patterns\n")
         
         # Find sources with best engagement improvements
-        sm_engagement = sm_wow[sm_wow['Total users_current'] > 100].copy()
+        sm_engagement = sm_wow[sm_wow['Total users_current'] > 100]
         if not sm_engagement.empty:
-            top_engagement = sm_engagement.nlargest(3, 'Engagement_Change')
+            top_engagement = self._top_n(sm_engagement, 'Engagement_Change', 3)
             insights.append("**Biggest Engagement Rate Improvements:**\n")
-            for _, row in top_engagement.iterrows():
-                insights.append(f"- {row['Session source / medium']}: "
-                              f"{row['Engagement_Change']:+.2%} change in engagement\n")
+            for source, engagement_chg in self._iter_columns(
+                top_engagement, ['Session source / medium', 'Engagement_Change']
+            ):
+                insights.append(f"- {source}: "
+                              f"{engagement_chg:+.2%} change in engagement\n")
         
         # Conversion insights
         insights.append("\n### Conversion Highlights\n")
-        sm_conversions = sm_wow[sm_wow['Key events_current'] > 10].copy()
+        sm_conversions = sm_wow[sm_wow['Key events_current'] > 10]
         if not sm_conversions.empty:
-            top_conversions = sm_conversions.nlargest(3, 'Key_Events_Change')
+            top_conversions = self._top_n(sm_conversions, 'Key_Events_Change', 3)
             insights.append("**Top Key Event Increases:**\n")
-            for _, row in top_conversions.iterrows():
-                insights.append(f"- {row['Session source / medium']}: "
-                              f"+{row['Key_Events_Change']:.0f} key events "
-                              f"({row['Key_Events_Change_Pct']:+.1f}%)\n")
+            for source, events_chg, events_pct in self._iter_columns(
+                top_conversions, ['Session source / medium', 'Key_Events_Change', 'Key_Events_Change_Pct']
+            ):
+                insights.append(f"- {source}: "
+                              f"+{events_chg:.0f} key events "
+                              f"({events_pct:+.1f}%)\n")
         
         return ''.join(insights)
     
@@ -521,11 +784,12 @@ class GA4WeekOverWeekAnalyzer:
         missing_dates_info = self.check_missing_dates(weeks)
         
         # Generate reports
-        channel_wow = self.generate_channel_report(weeks)
-        sm_wow = self.generate_source_medium_report(weeks)
-        lp_wow = self.generate_landing_page_report(weeks)
-        lp_source_wow = self.generate_landing_page_source_report(weeks)
-        lp_channel_wow = self.generate_landing_page_channel_report(weeks)
+        reports = self.aggregate_all_groupings(weeks)
+        channel_wow = reports['Session Payscale Custom Channels']
+        sm_wow = reports['Session source / medium']
+        lp_wow = reports['Page path and screen class']
+        lp_source_wow = reports['LP_Source']
+        lp_channel_wow = reports['LP_Channel']
         
         # Generate executive summary
         self.generate_executive_summary(channel_wow, sm_wow, lp_wow, lp_source_wow, lp_channel_wow, weeks, missing_dates_info)